@@ -18,18 +18,38 @@ Examples:
     python tgf_playing_handicap.py "Ali Akar, Mehmet Yılmaz" "Gloria"
 
 Requirements:
-    pip install selenium requests beautifulsoup4
+    pip install selenium requests
 """
 
+import atexit
 import sys
 import os
+import threading
 import hmac
 import hashlib
+import tempfile
 import time
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
+
+# NumPy vectorizes the tees x players handicap table when available;
+# the scalar loop remains as a fallback.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# orjson decodes the HandicapsLST responses 2-5x faster than stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from bs4 import BeautifulSoup
+from html import unescape
+import re
 
 # Fix Windows console encoding for Turkish characters
 if sys.platform == "win32":
@@ -38,6 +58,37 @@ if sys.platform == "win32":
 
 BASE_URL = "https://scoring.tgf.org.tr/lists/"
 
+# Selenium fallbacks are opt-in (--use-selenium).  Retrying the JSON API
+# across the minute boundary is almost always cheaper than booting a
+# browser, so that is the default failure path.
+USE_SELENIUM = False
+
+
+def _retry_with_backoff(fn, tries: int = 3, base: float = 1.0):
+    """Call `fn` until it returns a non-empty result, backing off between
+    attempts.  By the time the backoff has slept, a fresh minute-based
+    HMAC hash is available, so a retry usually succeeds where the first
+    attempt hit the boundary.  Re-raises the last exception (or returns
+    the last falsy result) once the attempts are exhausted.
+    """
+    delay = base
+    result = None
+    last_exc = None
+    for attempt in range(tries):
+        try:
+            result = fn()
+            if result:
+                return result
+            last_exc = None
+        except Exception as exc:
+            last_exc = exc
+        if attempt < tries - 1:
+            time.sleep(delay)
+            delay *= 2
+    if last_exc is not None:
+        raise last_exc
+    return result
+
 
 # ---------------------------------------------------------------------------
 # Session helper – the scoring sub-site requires an HMAC-authenticated hit
@@ -45,16 +96,68 @@ BASE_URL = "https://scoring.tgf.org.tr/lists/"
 # secret ("123") and the current day+month+minute, so it is time-sensitive.
 # ---------------------------------------------------------------------------
 
+# HMAC prototype with the shared secret and the constant "admin" prefix
+# already absorbed; per-hash work is then a cheap copy() + update()
+# instead of re-deriving the padded key blocks on every attempt.
+_HMAC_PROTO = hmac.new(b"123", b"admin", hashlib.sha1)
+
+# Authenticated sessions, one per "page" context (handicaps, calchcp...).
+# The HMAC hash is minute-based, so a cached session younger than 50 s is
+# guaranteed to still be within its minute window; reusing it also keeps
+# urllib3's pooled TLS connection hot across lookups.
+_SESSION_CACHE: dict[str, tuple[requests.Session, float]] = {}
+
+
+def _get_session(page: str, extra_params: str = "") -> requests.Session:
+    """Return a cached authenticated session for `page`, creating one if needed.
+
+    Sessions older than 50 s (or that lost their ASP.NET cookie) are
+    re-authenticated; everything younger is reused so a multi-player run
+    pays for the HMAC handshake and the TCP+TLS setup only once.
+    """
+    cached = _SESSION_CACHE.get(page)
+    if cached is not None:
+        session, created = cached
+        if time.time() - created < 50 and "ASP.NET_SessionId" in session.cookies:
+            return session
+        del _SESSION_CACHE[page]
+
+    session = _create_authenticated_session(page, extra_params)
+    if session is not None:
+        _SESSION_CACHE[page] = (session, time.time())
+    return session
+
+
 def _create_authenticated_session(page: str, extra_params: str = "") -> requests.Session:
     """Create a requests.Session with a valid ASP.NET session cookie.
 
-    Retries up to 10 times because the hash is minute-based and the server
-    can be flaky around the minute boundary.  We also try the previous and
-    next minute's hash on each attempt to handle clock-edge cases.
+    The hash is minute-based, so when we are within 2 s of the minute
+    boundary we wait it out rather than risk the hash expiring mid
+    request.  Each attempt also tries the previous and next minute's
+    hash to handle clock skew, which keeps the retry count low.
     """
     last_dt = None
-    for attempt in range(10):
+    for attempt in range(3):
+        # Don't build a hash that is about to roll over under us
+        seconds_to_boundary = 60 - datetime.now().second
+        if seconds_to_boundary < 2:
+            time.sleep(seconds_to_boundary + 0.1)
+
         session = requests.Session()
+        # Pooled adapter so the TLS connection survives across calls made
+        # through the cached session.  Transient 5xx responses are retried
+        # over the keep-alive pool instead of propagating and triggering
+        # the much more expensive fallback path.
+        session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+            ),
+        ))
         session.headers.update({
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -79,9 +182,9 @@ def _create_authenticated_session(page: str, extra_params: str = "") -> requests
             t = datetime.fromtimestamp(now.timestamp() + delta_sec)
             dt_str = f"{t.day}{t.month}{t.minute}"
             if dt_str not in [c[0] for c in candidates]:
-                msg = "admin" + dt_str
-                h = hmac.new(b"123", msg.encode(), hashlib.sha1).hexdigest()
-                candidates.append((dt_str, h))
+                h = _HMAC_PROTO.copy()
+                h.update(dt_str.encode("ascii"))
+                candidates.append((dt_str, h.hexdigest()))
 
         for dt_str, h in candidates:
             if dt_str == last_dt:
@@ -101,7 +204,9 @@ def _create_authenticated_session(page: str, extra_params: str = "") -> requests
             except requests.RequestException:
                 pass
 
-        time.sleep(3)
+        # Short pause before the next attempt, but never sleep past the
+        # minute boundary (a fresh hash becomes valid right after it).
+        time.sleep(min(1.5, 60 - datetime.now().second))
 
     return None
 
@@ -110,14 +215,42 @@ def _create_authenticated_session(page: str, extra_params: str = "") -> requests
 # Step 1 – look up player handicap
 # ---------------------------------------------------------------------------
 
-def search_player(name: str) -> list[dict]:
+# Static portion of every HandicapsLST POST; per-call code only fills in
+# the query fields instead of rebuilding the whole ~20-key dict.
+_HANDICAPS_PAYLOAD_BASE = {
+    "name": "", "fedno": "",
+    "ClubCode": "All", "FedStat": "9", "Gender": "All",
+    "Agelev": "All", "HcpStat": "All", "FHcp": "", "THcp": "",
+    "ProAm": "All", "IniFlag": "0", "FAge": "", "TAge": "",
+    "Permit": "", "MaxResults": "0", "MessMax": "",
+    "jtStartIndex": 0, "jtPageSize": 100, "jtSorting": "name ASC",
+}
+
+_HANDICAPS_HEADERS = {
+    "Content-Type": "application/json; charset=utf-8",
+    "X-Requested-With": "XMLHttpRequest",
+    "Referer": BASE_URL + "FederatedsList_V2.aspx",
+}
+
+
+def _encode_handicaps_payload(**overrides) -> bytes:
+    """Serialise the HandicapsLST payload with `overrides` applied.
+
+    Returning pre-encoded bytes (orjson when available) lets callers pass
+    `data=` and skip requests' own stdlib-json encoding step.
+    """
+    payload = {**_HANDICAPS_PAYLOAD_BASE, **overrides}
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def search_player(name: str, page_size: int = 100) -> list[dict]:
     """Search for a player by name on the TGF handicap list.
 
     Returns a list of matching player dicts.
     """
-    session = _create_authenticated_session(
-        "handicaps", "&ccode=All"
-    )
+    session = _get_session("handicaps", "&ccode=All")
 
     if session is None:
         raise RuntimeError(
@@ -132,59 +265,98 @@ def search_player(name: str) -> list[dict]:
         pass
 
     api_url = BASE_URL + "FederatedsList_V2.aspx/HandicapsLST"
-    payload = {
-        "name": name,
-        "fedno": "",
-        "ClubCode": "All",
-        "FedStat": "9",
-        "Gender": "All",
-        "Agelev": "All",
-        "HcpStat": "All",
-        "FHcp": "",
-        "THcp": "",
-        "ProAm": "All",
-        "IniFlag": "0",
-        "FAge": "",
-        "TAge": "",
-        "Permit": "",
-        "MaxResults": "0",
-        "MessMax": "",
-        "jtStartIndex": 0,
-        "jtPageSize": 100,
-        "jtSorting": "name ASC",
-    }
-
     resp = session.post(
         api_url,
-        json=payload,
-        headers={
-            "Content-Type": "application/json; charset=utf-8",
-            "X-Requested-With": "XMLHttpRequest",
-            "Referer": BASE_URL + "FederatedsList_V2.aspx",
-        },
+        data=_encode_handicaps_payload(name=name, jtPageSize=page_size),
+        headers=_HANDICAPS_HEADERS,
         timeout=15,
     )
     resp.raise_for_status()
+    return _records_to_players(_decode_records(resp))
+
+
+def search_players_bulk(names: list[str]) -> dict[str, list[dict] | None]:
+    """Look up several players with as few HandicapsLST calls as possible.
+
+    When all name queries share a common first token (typically a shared
+    surname), a single POST on that token fetches every candidate at once
+    and the results are bucketed client-side, so N lookups collapse into
+    one round-trip over the cached session.  Numeric federation numbers
+    and unrelated names fall back to individual calls.
+
+    Returns a dict mapping each original query to its candidate players,
+    or to None when that lookup failed and should be retried.
+    """
+    results: dict[str, list[dict]] = {}
 
-    data = resp.json()
-    records = data.get("d", {}).get("Records", [])
+    name_queries = [n for n in names if not n.strip().isdigit()]
+    fedno_queries = [n for n in names if n.strip().isdigit()]
 
+    # ---- Shared-token batch for name queries ----
+    tokens = [q.split()[0].casefold() for q in name_queries if q.split()]
+    if len(name_queries) > 1 and len(set(tokens)) == 1:
+        try:
+            pool = search_player(name_queries[0].split()[0], page_size=500)
+        except Exception:
+            pool = []
+        for query in name_queries:
+            wanted = query.casefold().split()
+            results[query] = [
+                p for p in pool
+                if all(t in p["name"].casefold() for t in wanted)
+            ]
+        name_queries = [q for q in name_queries if not results.get(q)]
+
+    # ---- Individual lookups for the rest, overlapped across threads ----
+    # requests releases the GIL during socket I/O, so N independent POSTs
+    # complete in roughly one round-trip instead of N.  The session is
+    # warmed first so the threads share one pooled connection.
+    remaining = name_queries + fedno_queries
+    if remaining:
+        _get_session("handicaps", "&ccode=All")
+        with ThreadPoolExecutor(max_workers=min(8, len(remaining))) as ex:
+            for query, players in zip(remaining, ex.map(_fetch_player_records, remaining)):
+                results[query] = players
+
+    return results
+
+
+def _fetch_player_records(query: str) -> list[dict] | None:
+    """Fetch candidate records for one query.  Network-only and thread-safe;
+    interactive disambiguation stays in `resolve_player` on the main thread.
+
+    Returns None when the lookup itself failed, so callers can tell a
+    transient error apart from a genuinely empty result and re-search.
+    """
+    try:
+        if query.strip().isdigit():
+            return _search_by_fedno(query.strip())
+        return search_player(query)
+    except Exception:
+        return None
+
+
+def _decode_records(resp: requests.Response) -> list[dict]:
+    """Decode a HandicapsLST response down to just its record list."""
+    data = orjson.loads(resp.content) if orjson is not None else resp.json()
+    return data.get("d", {}).get("Records", [])
+
+
+def _records_to_players(records: list[dict]) -> list[dict]:
+    """Project raw HandicapsLST records into our player dict shape."""
     players = []
     for r in records:
         hcp_raw = r.get("hcp_exact")
-        hcp_value = hcp_raw / 10.0 if hcp_raw is not None else None
-
         players.append({
             "fed_no": r.get("federation_code"),
             "name": r.get("name"),
             "club": r.get("acronym"),
             "club_code": r.get("club_code"),
-            "hcp_index": hcp_value,
+            "hcp_index": hcp_raw / 10.0 if hcp_raw is not None else None,
             "hcp_status": r.get("hcp_status"),
             "gender": r.get("gender"),
             "age_group": r.get("age_level"),
         })
-
     return players
 
 
@@ -202,6 +374,8 @@ def _create_chrome_driver():
     from selenium.webdriver.chrome.service import Service
 
     options = webdriver.ChromeOptions()
+    # Return from driver.get on DOMContentLoaded instead of the full load
+    options.page_load_strategy = "eager"
     options.add_argument("--headless=new")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
@@ -221,83 +395,143 @@ def _create_chrome_driver():
     return webdriver.Chrome(options=options)
 
 
+# Chrome startup alone costs ~1-2 s, so one lazily created instance is
+# shared by every Selenium fallback and quit at interpreter exit.
+# WebDriver is not thread-safe, so every use of the shared driver (the
+# web app runs the fallbacks from worker threads) holds this lock for
+# the whole get/switch/scrape sequence, not just creation.
+_DRIVER = None
+_DRIVER_LOCK = threading.RLock()
+
+
+def _get_driver():
+    """Return the shared headless Chrome driver, creating it on first use."""
+    global _DRIVER
+    with _DRIVER_LOCK:
+        if _DRIVER is None:
+            _DRIVER = _create_chrome_driver()
+            atexit.register(_quit_driver)
+        return _DRIVER
+
+
+def _quit_driver():
+    global _DRIVER
+    with _DRIVER_LOCK:
+        if _DRIVER is not None:
+            try:
+                _DRIVER.quit()
+            except Exception:
+                pass
+            _DRIVER = None
+
+
 # ---------------------------------------------------------------------------
 # Step 1 (fallback) – scrape the handicap list HTML table with Selenium
 # ---------------------------------------------------------------------------
 
+# The jtable club column renders as "Club Name (code)"
+_CLUB_RE = re.compile(r"^(.*)\((\w+)\)\s*$")
+
+
+def _split_club(club_text: str) -> tuple[str, str]:
+    """Split "Club Name (code)" into (name, code); code is "" when absent."""
+    m = _CLUB_RE.match(club_text)
+    if m:
+        return m.group(1).strip(), m.group(2)
+    return club_text, ""
+
+
+def _wait_for_jtable_rows(driver) -> None:
+    """Wait until jtable has rendered either data rows or its empty-state
+    row.  A timeout is treated the same as "no records", so callers fall
+    through to an empty result instead of raising after 10s on queries
+    that legitimately match nothing.
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((
+                By.CSS_SELECTOR,
+                ".jtable tbody tr.jtable-data-row,"
+                " .jtable tbody tr.jtable-no-data-row",
+            ))
+        )
+    except TimeoutException:
+        pass
+
+
 def search_player_selenium(name: str) -> list[dict]:
     """Fallback: use Selenium to search the handicap list when the API fails."""
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
 
-    driver = _create_chrome_driver()
-    players = []
+    with _DRIVER_LOCK:
+        driver = _get_driver()
+        players = []
 
-    try:
-        driver.get("https://www.tgf.org.tr/tr/handikap-listesi")
-        time.sleep(3)
+        try:
+            driver.get("https://www.tgf.org.tr/tr/handikap-listesi")
 
-        # Switch to the iframe
-        iframe = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "iframe"))
-        )
-        driver.switch_to.frame(iframe)
+            # Switch to the iframe as soon as it is available
+            WebDriverWait(driver, 10).until(
+                EC.frame_to_be_available_and_switch_to_it((By.TAG_NAME, "iframe"))
+            )
 
-        # Wait for the search form
-        name_input = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "insrhname"))
-        )
-        name_input.clear()
-        name_input.send_keys(name)
-
-        # Click the search button
-        search_btn = driver.find_element(By.ID, "btnSearch")
-        search_btn.click()
-
-        # Wait for results
-        time.sleep(3)
-
-        # Parse the results table
-        rows = driver.find_elements(By.CSS_SELECTOR, ".jtable tbody tr.jtable-data-row")
-
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) >= 9:
-                fed_no = cells[0].text.strip()
-                pname = cells[1].text.strip()
-                club_text = cells[2].text.strip()
-                hcp_text = cells[3].text.strip()
-                hcp_status = cells[4].text.strip()
-                am_pro = cells[5].text.strip()
-                gender = cells[6].text.strip()
-                age_group = cells[7].text.strip()
-
-                # Parse club code from "Club Name (code)" format
-                club = club_text
-                club_code = ""
-                if "(" in club_text and ")" in club_text:
-                    parts = club_text.rsplit("(", 1)
-                    club = parts[0].strip()
-                    club_code = parts[1].rstrip(")")
-
-                try:
-                    hcp_value = float(hcp_text) if hcp_text and hcp_text != "-" else None
-                except ValueError:
-                    hcp_value = None
-
-                players.append({
-                    "fed_no": fed_no,
-                    "name": pname,
-                    "club": club,
-                    "club_code": club_code,
-                    "hcp_index": hcp_value,
-                    "hcp_status": hcp_status,
-                    "gender": gender,
-                    "age_group": age_group,
-                })
-    finally:
-        driver.quit()
+            # Wait for the search form
+            name_input = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.ID, "insrhname"))
+            )
+            name_input.clear()
+            name_input.send_keys(name)
+
+            # Click the search button
+            search_btn = driver.find_element(By.ID, "btnSearch")
+            search_btn.click()
+
+            # Wait for result rows (or the empty state) rather than sleeping
+            # a fixed interval
+            _wait_for_jtable_rows(driver)
+
+            # Parse the results table
+            rows = driver.find_elements(By.CSS_SELECTOR, ".jtable tbody tr.jtable-data-row")
+
+            for row in rows:
+                cells = row.find_elements(By.TAG_NAME, "td")
+                if len(cells) >= 9:
+                    fed_no = cells[0].text.strip()
+                    pname = cells[1].text.strip()
+                    club_text = cells[2].text.strip()
+                    hcp_text = cells[3].text.strip()
+                    hcp_status = cells[4].text.strip()
+                    am_pro = cells[5].text.strip()
+                    gender = cells[6].text.strip()
+                    age_group = cells[7].text.strip()
+
+                    club, club_code = _split_club(club_text)
+
+                    try:
+                        hcp_value = float(hcp_text) if hcp_text and hcp_text != "-" else None
+                    except ValueError:
+                        hcp_value = None
+
+                    players.append({
+                        "fed_no": fed_no,
+                        "name": pname,
+                        "club": club,
+                        "club_code": club_code,
+                        "hcp_index": hcp_value,
+                        "hcp_status": hcp_status,
+                        "gender": gender,
+                        "age_group": age_group,
+                    })
+        finally:
+            # Leave the shared driver in the top-level browsing context
+            driver.switch_to.default_content()
 
     return players
 
@@ -306,25 +540,83 @@ def search_player_selenium(name: str) -> list[dict]:
 # Step 2 – get course data from the playing HCP calculator page
 # ---------------------------------------------------------------------------
 
-def get_courses() -> list[dict]:
-    """Fetch all course/tee data from the TGF CalcPlayHcp page.
+# Slope/CR/par data changes a few times a year at most, so repeat runs
+# within a day can skip the network round-trip and the parse entirely.
+_COURSE_CACHE_TTL = 86400
+
+
+def _course_cache_path(query: str | None = None) -> str:
+    suffix = re.sub(r"\W+", "_", query.lower()).strip("_") if query else "all"
+    return os.path.join(tempfile.gettempdir(), f"tgf_courses_{suffix}.json")
+
 
-    Tries the requests-based approach first, falls back to Selenium.
+def get_courses(refresh: bool = False, query: str | None = None) -> list[dict]:
+    """Fetch course/tee data from the TGF CalcPlayHcp page.
+
+    `query` narrows both the parse and the on-disk cache to courses
+    whose name contains it, so a targeted run never materialises the
+    full nationwide list.  Results are cached on disk for a day (see
+    `--refresh-courses` to force a refetch).  On a cache miss, retries
+    the requests-based approach with backoff; Selenium is only tried
+    with --use-selenium.
     """
-    courses = _get_courses_requests()
-    if courses:
-        return courses
+    cache_path = _course_cache_path(query)
+
+    if not refresh:
+        try:
+            if time.time() - os.path.getmtime(cache_path) < _COURSE_CACHE_TTL:
+                with open(cache_path, encoding="utf-8") as f:
+                    return _attach_name_index(json.load(f))
+        except (OSError, ValueError):
+            pass  # missing/corrupt cache – fall through to a fresh fetch
+
+        # A fresh unfiltered cache can satisfy any query without the network
+        if query:
+            full_path = _course_cache_path()
+            try:
+                if time.time() - os.path.getmtime(full_path) < _COURSE_CACHE_TTL:
+                    with open(full_path, encoding="utf-8") as f:
+                        return find_courses_by_name(
+                            _attach_name_index(json.load(f)), query
+                        )
+            except (OSError, ValueError):
+                pass
+
     try:
-        return _get_courses_selenium()
+        courses = _retry_with_backoff(lambda: _get_courses_requests(query))
     except Exception:
-        return []
+        courses = []
+    if not courses and USE_SELENIUM:
+        try:
+            courses = _get_courses_selenium(query)
+        except Exception:
+            return []
+
+    if courses:
+        try:
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(courses, f)
+        except OSError:
+            pass  # cache is best-effort only
 
+    return _attach_name_index(courses)
 
-def _get_courses_requests() -> list[dict]:
+
+def _attach_name_index(courses: list[dict]) -> list[dict]:
+    """Precompute the lowercased name and base name on each course dict.
+
+    Filtering and base-name grouping then avoid re-running lower() and
+    rsplit() over the whole list on every scan.
+    """
+    for c in courses:
+        c["_name_lc"] = c["name"].lower()
+        c["_base_name"] = c["name"].rsplit(" - ", 1)[0]
+    return courses
+
+
+def _get_courses_requests(query: str | None = None) -> list[dict]:
     """Try to fetch courses via authenticated requests session."""
-    session = _create_authenticated_session(
-        "calchcp", "&fedno=&tcode=&param="
-    )
+    session = _get_session("calchcp", "&fedno=&tcode=&param=")
     if session is None:
         return []
 
@@ -335,66 +627,77 @@ def _get_courses_requests() -> list[dict]:
         )
         if resp.status_code != 200:
             return []
-        return _parse_courses_html(resp.text)
+        return _parse_courses_html(resp.text, query)
     except requests.RequestException:
         return []
 
 
-def _get_courses_selenium() -> list[dict]:
+def _get_courses_selenium(query: str | None = None) -> list[dict]:
     """Fallback: use Selenium to load the CalcPlayHcp page."""
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
 
-    driver = _create_chrome_driver()
-    try:
-        driver.get("https://www.tgf.org.tr/tr/oyun-hcp-hesaplama")
-        time.sleep(3)
+    with _DRIVER_LOCK:
+        driver = _get_driver()
+        try:
+            driver.get("https://www.tgf.org.tr/tr/oyun-hcp-hesaplama")
 
-        iframe = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "iframe"))
-        )
-        driver.switch_to.frame(iframe)
+            WebDriverWait(driver, 10).until(
+                EC.frame_to_be_available_and_switch_to_it((By.TAG_NAME, "iframe"))
+            )
 
-        # Wait for the courses dropdown
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "DpCourses"))
-        )
+            # Wait for the courses dropdown
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.ID, "DpCourses"))
+            )
 
-        return _parse_courses_html(driver.page_source)
-    finally:
-        driver.quit()
+            return _parse_courses_html(driver.page_source, query)
+        finally:
+            driver.switch_to.default_content()
 
 
-def _parse_courses_html(html: str) -> list[dict]:
-    """Parse course data from the CalcPlayHcp page HTML."""
-    soup = BeautifulSoup(html, "html.parser")
-    select = soup.find("select", id="DpCourses")
-    if not select:
+# The courses live in one <select id="DpCourses"> whose option values are
+# fixed-width packed digit strings — a compiled regex over that slice of
+# the page beats building a DOM for the whole document.  Requiring 27+
+# digits also filters out the "Manuel" placeholder option.
+_OPT_RE = re.compile(r'<option[^>]*value="(\d{27,})"[^>]*>([^<]+)</option>')
+
+
+def _parse_courses_html(html: str, name_filter: str | None = None) -> list[dict]:
+    """Parse course data from the CalcPlayHcp page HTML.
+
+    When `name_filter` is given, options whose text does not contain it
+    (case-insensitively) are skipped before any dict is built.
+    """
+    start = html.find('id="DpCourses"')
+    if start == -1:
         return []
+    end = html.find("</select>", start)
+    segment = html[start:end] if end != -1 else html[start:]
+    name_filter = name_filter.lower() if name_filter else None
 
     courses = []
-    for option in select.find_all("option"):
-        text = option.get_text(strip=True)
-        value = option.get("value", "")
-
-        if text == "Manuel" or len(value) < 27:
+    for value, text in _OPT_RE.findall(segment):
+        # BeautifulSoup decoded entities for us; the regex does not, so
+        # names like "Kemer G&amp;CC" must be unescaped by hand.
+        text = unescape(text).strip()
+        if name_filter and name_filter not in text.lower():
             continue
 
         # Packed value: PAR18(3) CR18(3) SL18(3) PAR9F(3) CR9F(3) SL9F(3) PAR9B(3) CR9B(3) SL9B(3)
-        # Course Rating stored as int*10 (677 -> 67.7)
-        try:
-            par_18   = int(value[0:3])
-            cr_18    = int(value[3:6]) / 10.0
-            slope_18 = int(value[6:9])
-            par_f9   = int(value[9:12])
-            cr_f9    = int(value[12:15]) / 10.0
-            slope_f9 = int(value[15:18])
-            par_b9   = int(value[18:21])
-            cr_b9    = int(value[21:24]) / 10.0
-            slope_b9 = int(value[24:27])
-        except (ValueError, IndexError):
-            continue
+        # Course Rating stored as int*10 (677 -> 67.7).  Parse the 27
+        # digits once and peel off the nine 3-digit groups with divmod,
+        # instead of nine substring allocations and int() calls.
+        n = int(value[:27])
+        fields = []
+        for _ in range(9):
+            n, d = divmod(n, 1000)
+            fields.append(d)
+        (slope_b9, cr_b9, par_b9,
+         slope_f9, cr_f9, par_f9,
+         slope_18, cr_18, par_18) = fields
+        cr_18, cr_f9, cr_b9 = cr_18 / 10.0, cr_f9 / 10.0, cr_b9 / 10.0
 
         courses.append({
             "name": text,
@@ -409,7 +712,7 @@ def _parse_courses_html(html: str) -> list[dict]:
 def find_courses_by_name(courses: list[dict], query: str) -> list[dict]:
     """Find courses whose name contains the query string (case-insensitive)."""
     q = query.lower()
-    return [c for c in courses if q in c["name"].lower()]
+    return [c for c in courses if q in c["_name_lc"]]
 
 
 # ---------------------------------------------------------------------------
@@ -435,48 +738,37 @@ def calc_playing_handicap(
 # ---------------------------------------------------------------------------
 
 def _search_by_fedno(fedno: str) -> list[dict]:
-    """Search for a player by federation number."""
+    """Search for a player by federation number.
+
+    Retries the JSON API with backoff on failure; the Selenium scrape is
+    only used when --use-selenium was given.
+    """
     try:
-        session = _create_authenticated_session("handicaps", "&ccode=All")
-        if session is None:
-            raise RuntimeError("no session")
-
-        api_url = BASE_URL + "FederatedsList_V2.aspx/HandicapsLST"
-        payload = {
-            "name": "", "fedno": fedno,
-            "ClubCode": "All", "FedStat": "9", "Gender": "All",
-            "Agelev": "All", "HcpStat": "All", "FHcp": "", "THcp": "",
-            "ProAm": "All", "IniFlag": "0", "FAge": "", "TAge": "",
-            "Permit": "", "MaxResults": "0", "MessMax": "",
-            "jtStartIndex": 0, "jtPageSize": 10, "jtSorting": "name ASC",
-        }
-        resp = session.post(
-            api_url, json=payload,
-            headers={
-                "Content-Type": "application/json; charset=utf-8",
-                "X-Requested-With": "XMLHttpRequest",
-                "Referer": BASE_URL + "FederatedsList_V2.aspx",
-            },
-            timeout=15,
-        )
-        resp.raise_for_status()
-        records = resp.json().get("d", {}).get("Records", [])
-        players = []
-        for r in records:
-            hcp_raw = r.get("hcp_exact")
-            players.append({
-                "fed_no": r.get("federation_code"),
-                "name": r.get("name"),
-                "club": r.get("acronym"),
-                "club_code": r.get("club_code"),
-                "hcp_index": hcp_raw / 10.0 if hcp_raw is not None else None,
-                "hcp_status": r.get("hcp_status"),
-                "gender": r.get("gender"),
-                "age_group": r.get("age_level"),
-            })
-        return players
+        return _search_by_fedno_api(fedno)
     except Exception:
-        return _search_by_fedno_selenium(fedno)
+        if USE_SELENIUM:
+            return _search_by_fedno_selenium(fedno)
+        try:
+            return _retry_with_backoff(lambda: _search_by_fedno_api(fedno)) or []
+        except Exception:
+            return []
+
+
+def _search_by_fedno_api(fedno: str) -> list[dict]:
+    """Search for a player by federation number via the JSON API."""
+    session = _get_session("handicaps", "&ccode=All")
+    if session is None:
+        raise RuntimeError("no session")
+
+    api_url = BASE_URL + "FederatedsList_V2.aspx/HandicapsLST"
+    resp = session.post(
+        api_url,
+        data=_encode_handicaps_payload(fedno=fedno, jtPageSize=10),
+        headers=_HANDICAPS_HEADERS,
+        timeout=15,
+    )
+    resp.raise_for_status()
+    return _records_to_players(_decode_records(resp))
 
 
 def _search_by_fedno_selenium(fedno: str) -> list[dict]:
@@ -485,75 +777,85 @@ def _search_by_fedno_selenium(fedno: str) -> list[dict]:
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
 
-    driver = _create_chrome_driver()
-    players = []
-    try:
-        driver.get("https://www.tgf.org.tr/tr/handikap-listesi")
-        time.sleep(3)
-        iframe = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "iframe"))
-        )
-        driver.switch_to.frame(iframe)
-        fedno_input = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "insrhfedno"))
-        )
-        fedno_input.clear()
-        fedno_input.send_keys(fedno)
-        driver.find_element(By.ID, "btnSearch").click()
-        time.sleep(3)
+    with _DRIVER_LOCK:
+        driver = _get_driver()
+        players = []
+        try:
+            driver.get("https://www.tgf.org.tr/tr/handikap-listesi")
+            WebDriverWait(driver, 10).until(
+                EC.frame_to_be_available_and_switch_to_it((By.TAG_NAME, "iframe"))
+            )
+            fedno_input = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.ID, "insrhfedno"))
+            )
+            fedno_input.clear()
+            fedno_input.send_keys(fedno)
+            driver.find_element(By.ID, "btnSearch").click()
+            _wait_for_jtable_rows(driver)
 
-        rows = driver.find_elements(
-            By.CSS_SELECTOR, ".jtable tbody tr.jtable-data-row"
-        )
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) >= 9:
-                club_text = cells[2].text.strip()
-                club, club_code = club_text, ""
-                if "(" in club_text and ")" in club_text:
-                    parts = club_text.rsplit("(", 1)
-                    club = parts[0].strip()
-                    club_code = parts[1].rstrip(")")
-                hcp_text = cells[3].text.strip()
-                try:
-                    hcp_val = float(hcp_text) if hcp_text and hcp_text != "-" else None
-                except ValueError:
-                    hcp_val = None
-                players.append({
-                    "fed_no": cells[0].text.strip(),
-                    "name": cells[1].text.strip(),
-                    "club": club, "club_code": club_code,
-                    "hcp_index": hcp_val,
-                    "hcp_status": cells[4].text.strip(),
-                    "gender": cells[6].text.strip(),
-                    "age_group": cells[7].text.strip(),
-                })
-    finally:
-        driver.quit()
+            rows = driver.find_elements(
+                By.CSS_SELECTOR, ".jtable tbody tr.jtable-data-row"
+            )
+            for row in rows:
+                cells = row.find_elements(By.TAG_NAME, "td")
+                if len(cells) >= 9:
+                    club, club_code = _split_club(cells[2].text.strip())
+                    hcp_text = cells[3].text.strip()
+                    try:
+                        hcp_val = float(hcp_text) if hcp_text and hcp_text != "-" else None
+                    except ValueError:
+                        hcp_val = None
+                    players.append({
+                        "fed_no": cells[0].text.strip(),
+                        "name": cells[1].text.strip(),
+                        "club": club, "club_code": club_code,
+                        "hcp_index": hcp_val,
+                        "hcp_status": cells[4].text.strip(),
+                        "gender": cells[6].text.strip(),
+                        "age_group": cells[7].text.strip(),
+                    })
+        finally:
+            driver.switch_to.default_content()
     return players
 
 
-def resolve_player(name_or_id: str) -> dict | None:
+def resolve_player(name_or_id: str, players: list[dict] | None = None) -> dict | None:
     """Resolve a player name OR federation number to one confirmed player.
 
     - If the input is purely numeric, search by Federation Number directly.
     - Otherwise search by name, prefer exact matches, and ask the user to
       pick when there is ambiguity.
+
+    `players` may carry candidates prefetched by `search_players_bulk`, in
+    which case no network I/O happens here; a prefetch that failed arrives
+    as None and is re-searched below with the usual retry (or browser)
+    fallback, while a genuinely empty prefetch stays "no players found".
     """
     is_fedno = name_or_id.strip().isdigit()
 
     if is_fedno:
         # ---- Search by Federation Number ----
         print(f"Looking up Federation No: {name_or_id}")
-        players = _search_by_fedno(name_or_id.strip())
+        if players is None:
+            players = _search_by_fedno(name_or_id.strip())
     else:
         # ---- Search by name ----
         print(f"Searching for player: {name_or_id}")
-        try:
-            players = search_player(name_or_id)
-        except Exception:
-            print("  API method failed, trying browser fallback...")
-            players = search_player_selenium(name_or_id)
+        if players is None:
+            try:
+                players = search_player(name_or_id)
+            except Exception:
+                if USE_SELENIUM:
+                    print("  API method failed, trying browser fallback...")
+                    players = search_player_selenium(name_or_id)
+                else:
+                    print("  API method failed, retrying...")
+                    try:
+                        players = _retry_with_backoff(
+                            lambda: search_player(name_or_id)
+                        ) or []
+                    except Exception:
+                        players = []
 
     if not players:
         print(f"  No players found matching '{name_or_id}'.\n")
@@ -631,6 +933,16 @@ def resolve_player(name_or_id: str) -> dict | None:
 # ---------------------------------------------------------------------------
 
 def main():
+    global USE_SELENIUM
+
+    refresh_courses = "--refresh-courses" in sys.argv
+    if refresh_courses:
+        sys.argv.remove("--refresh-courses")
+
+    if "--use-selenium" in sys.argv:
+        USE_SELENIUM = True
+        sys.argv.remove("--use-selenium")
+
     if len(sys.argv) < 3:
         print('Usage: python tgf_playing_handicap.py "Player(s)" "Course Name"')
         print()
@@ -642,6 +954,11 @@ def main():
         print()
         print("Multiple players (comma-separated names and/or Fed numbers):")
         print('  python tgf_playing_handicap.py "Ali Akar, 6099, Mehmet Yılmaz" "Gloria"')
+        print()
+        print("Options:")
+        print("  --refresh-courses   Ignore the cached course list and refetch it")
+        print("  --use-selenium      Allow the headless-browser fallback when the")
+        print("                      API fails (default: retry the API instead)")
         sys.exit(1)
 
     player_names_raw = sys.argv[1]
@@ -655,9 +972,13 @@ def main():
     print("PLAYER LOOKUP")
     print("=" * 60)
 
+    # Fetch all candidates up front (one POST when names share a surname
+    # token), then disambiguate interactively without further network I/O.
+    prefetched = search_players_bulk(player_names)
+
     confirmed_players: list[dict] = []
     for name in player_names:
-        player = resolve_player(name)
+        player = resolve_player(name, prefetched.get(name))
         if player:
             confirmed_players.append(player)
 
@@ -672,20 +993,24 @@ def main():
     print(f"Searching for course: {course_query}")
     print()
 
-    all_courses = get_courses()
-    if not all_courses:
-        print("ERROR: Could not retrieve course data from TGF.")
-        sys.exit(1)
-
+    all_courses = get_courses(refresh=refresh_courses, query=course_query)
     matching = find_courses_by_name(all_courses, course_query)
 
     if not matching:
+        # Nothing matched the keyword – load the full list so we can tell
+        # a missing course apart from an unreachable server, and list the
+        # alternatives.
+        all_courses = get_courses()
+        if not all_courses:
+            print("ERROR: Could not retrieve course data from TGF.")
+            sys.exit(1)
+
         print(f"No courses found matching '{course_query}'.")
         print()
         print("Available courses:")
         seen = set()
         for c in sorted(all_courses, key=lambda x: x["name"]):
-            base = c["name"].rsplit(" - ", 1)[0]
+            base = c["_base_name"]
             if base not in seen:
                 seen.add(base)
                 print(f"  - {base}")
@@ -694,8 +1019,7 @@ def main():
     # Group by base course name
     base_names: dict[str, list[dict]] = {}
     for c in matching:
-        base = c["name"].rsplit(" - ", 1)[0]
-        base_names.setdefault(base, []).append(c)
+        base_names.setdefault(c["_base_name"], []).append(c)
 
     if len(base_names) > 1:
         print(f"Multiple courses match '{course_query}':")
@@ -734,31 +1058,47 @@ def main():
         tee = course["name"].rsplit(" - ", 1)[-1] if " - " in course["name"] else course["name"]
         tee_names.append(tee)
 
-    # Determine column widths
+    # Determine column widths (once – they are constant across rows)
     player_col_width = max(12, max(len(p["name"]) for p in confirmed_players) + 2)
     tee_col_width = max(8, max(len(t) for t in tee_names) + 2)
+    player_display = [f"{p['name']} ({p['hcp_index']})" for p in confirmed_players]
+    col_widths = [max(player_col_width, len(d)) for d in player_display]
 
     # --- Header row ---
     header = f"{'Tee':<{tee_col_width}} {'PAR':>4} {'Rating':>7} {'Slope':>6}"
-    for p in confirmed_players:
-        display = f"{p['name']} ({p['hcp_index']})"
-        header += f"  {display:>{player_col_width}}"
+    for display, col_w in zip(player_display, col_widths):
+        header += f"  {display:>{col_w}}"
     print(header)
     print("=" * len(header))
 
+    # --- Playing handicaps, whole tees x players grid at once ---
+    if np is not None:
+        idx = np.array([p["hcp_index"] for p in confirmed_players], dtype=float)
+        slope = np.array([c["slope_18"] for c in tees_sorted], dtype=float)
+        cr = np.array([c["cr_18"] for c in tees_sorted], dtype=float)
+        par = np.array([c["par_18"] for c in tees_sorted], dtype=float)
+        grid = np.rint(idx[None, :] * (slope[:, None] / 113.0)
+                       + (cr - par)[:, None]).astype(int)
+        valid = (slope != 0) & (cr != 0)
+        phcp_rows = [
+            [int(v) if ok else None for v in row]
+            for row, ok in zip(grid, valid)
+        ]
+    else:
+        phcp_rows = [
+            [calc_playing_handicap(p["hcp_index"], c["slope_18"],
+                                   c["cr_18"], c["par_18"])
+             for p in confirmed_players]
+            for c in tees_sorted
+        ]
+
     # --- Data rows ---
-    for course, tee in zip(tees_sorted, tee_names):
+    for course, tee, phcps in zip(tees_sorted, tee_names, phcp_rows):
         row = (f"{tee:<{tee_col_width}} {course['par_18']:>4} "
                f"{course['cr_18']:>7.1f} {course['slope_18']:>6}")
 
-        for p in confirmed_players:
-            phcp = calc_playing_handicap(
-                p["hcp_index"], course["slope_18"],
-                course["cr_18"], course["par_18"],
-            )
+        for phcp, col_w in zip(phcps, col_widths):
             val = str(phcp) if phcp is not None else "N/A"
-            display_w = len(f"{p['name']} ({p['hcp_index']})")
-            col_w = max(player_col_width, display_w)
             row += f"  {val:>{col_w}}"
 
         print(row)
@@ -20,26 +20,165 @@ if sys.platform == "win32":
 # Make sure we can import the backend module sitting next to this file
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, abort, request
 import tgf_playing_handicap as tgf  # reuse all backend logic
+
+# orjson encodes/decodes several times faster than stdlib json; fall
+# back transparently when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# brotli compresses the static page better than gzip when available.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# ijson lets us decode TGF search responses incrementally off the
+# socket instead of buffering the whole body first.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# NumPy computes the tees x players handicap grid in one broadcast.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba, when installed, compiles the grid kernel to a native parallel
+# loop; the NumPy broadcast stays as the fallback.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+_calc_batch = None
+if njit is not None and np is not None:
+    # No fastmath: the NaN propagation for missing handicaps must survive.
+    @njit(cache=True, parallel=True)
+    def _calc_batch(hcp, slope, cr, par, out):
+        for t in prange(slope.shape[0]):
+            base = cr[t] - par[t]
+            for p in range(hcp.shape[0]):
+                out[t, p] = np.rint(hcp[p] * slope[t] / 113.0 + base)
+
+    # Warm the JIT at import time so the first request doesn't pay the
+    # compilation cost.
+    _calc_batch(np.zeros(1), np.ones(1), np.zeros(1), np.zeros(1),
+                np.zeros((1, 1)))
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import gzip
+import hashlib
+import json
+import logging
+import re
 import threading
 import time
-from datetime import date
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from operator import itemgetter
 
 app = Flask(__name__)
+log = logging.getLogger(__name__)
+
+
+def ojson(obj, status: int = 200) -> Response:
+    """jsonify() replacement backed by orjson when available."""
+    if orjson is not None:
+        body = orjson.dumps(obj)
+    else:
+        body = json.dumps(obj).encode()
+    return Response(body, status=status, mimetype="application/json")
+
+
+def _request_json() -> dict:
+    """Decode the request body without going through Flask's json module.
+
+    Malformed bodies abort with a 400 JSON payload, matching what
+    request.get_json(force=True) used to do.
+    """
+    data = request.get_data()
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError:
+        abort(ojson({"error": "Invalid JSON body"}, 400))
 
 # ── Cache courses so we don't re-fetch on every request ──────────────
+# Readers access these from any thread without a lock, so rebuilds must
+# construct complete structures locally and swap them in with plain
+# (atomic) assignments – never mutate them in place.
+_course_build_lock = threading.Lock()
 _course_cache: list[dict] = []
+_course_index: dict[str, list[dict]] = {}   # base_name -> tees, slope desc
+_courses_json_bytes: bytes = b""            # prebuilt /api/courses body
+_courses_json_gz: bytes = b""               # ...and its gzip variant
+_course_search_idx: list[tuple[str, str]] = []  # (casefolded, original) base names
+_courses_json_etag: str = ""                # ETag over _courses_json_bytes
 
 
 def _get_courses_cached() -> list[dict]:
     global _course_cache
     if not _course_cache:
-        _course_cache = tgf.get_courses()
+        with _course_build_lock:
+            if not _course_cache:
+                courses = tgf.get_courses()
+                _build_course_index(courses)
+                _course_cache = courses
     return _course_cache
 
 
+def _build_course_index(courses: list[dict]) -> None:
+    """Group courses by base name, with tee split out and tees pre-sorted.
+
+    Doing this once at cache-load time turns the per-request scans in
+    api_courses/api_calculate into plain dict lookups.
+    """
+    index: dict[str, list[dict]] = {}
+    for c in courses:
+        base = c["name"].rsplit(" - ", 1)[0]
+        tee = c["name"].rsplit(" - ", 1)[-1] if " - " in c["name"] else ""
+        entry = {k: v for k, v in c.items() if not k.startswith("_")}
+        entry["base_name"] = base
+        entry["tee"] = tee
+        index.setdefault(base, []).append(entry)
+    for tees in index.values():
+        tees.sort(key=itemgetter("slope_18"), reverse=True)
+
+    # The index is stable for the process lifetime, so serialise (and
+    # compress) the /api/courses body once instead of on every GET.
+    if orjson is not None:
+        body = orjson.dumps({"courses": index})
+    else:
+        body = json.dumps({"courses": index}, separators=(",", ":")).encode()
+
+    # Casefolded base names for the substring search endpoint – one tight
+    # scan over interned strings instead of casefolding per keystroke.
+    search_idx = sorted((sys.intern(n.casefold()), n) for n in index)
+
+    gz = gzip.compress(body, 9)
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+    # Publish the finished structures; concurrent readers see either the
+    # old complete index or the new one, never a half-built state.
+    global _course_index, _courses_json_bytes, _courses_json_gz, \
+        _courses_json_etag, _course_search_idx
+    _course_index = index
+    _courses_json_bytes = body
+    _courses_json_gz = gz
+    _courses_json_etag = etag
+    _course_search_idx = search_idx
+
+
 # ── Cache TGF session & player lookups ───────────────────────────────
 
 _tgf_session_lock = threading.Lock()
@@ -47,7 +186,42 @@ _tgf_session: requests.Session | None = None
 _tgf_session_time: float = 0
 
 _player_cache_lock = threading.Lock()
-_player_cache: dict[str, dict] = {}   # {query_lower: {"players": [...], "date": date}}
+# {query_lower: {"players": [...], "active": [...], "date": ordinal}} in LRU
+# order; bounded so arbitrary user queries can't grow memory forever.
+_player_cache: OrderedDict[str, dict] = OrderedDict()
+_PLAYER_CACHE_MAX = 1024
+
+# Searches currently being resolved, keyed like the cache; concurrent
+# requests for the same query wait on the first one's future instead of
+# starting a second TGF round-trip.
+_in_flight: dict[str, Future] = {}
+
+# Overlaps the independent TGF lookups of a batch search request
+_search_pool = ThreadPoolExecutor(max_workers=8)
+
+# Day ordinal used to expire player-cache entries: a timer rolls it over
+# at midnight so the hot path compares two ints instead of constructing
+# a date object per request.
+_today_epoch = date.today().toordinal()
+
+
+def _roll_today_epoch() -> None:
+    global _today_epoch
+    _today_epoch = date.today().toordinal()
+    _schedule_epoch_roll()
+
+
+def _schedule_epoch_roll() -> None:
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1),
+                                datetime.min.time())
+    timer = threading.Timer((midnight - now).total_seconds() + 1,
+                            _roll_today_epoch)
+    timer.daemon = True
+    timer.start()
+
+
+_schedule_epoch_roll()
 
 
 def _get_or_create_tgf_session() -> requests.Session | None:
@@ -62,6 +236,22 @@ def _get_or_create_tgf_session() -> requests.Session | None:
         if session is None:
             return None
 
+        # Re-mount with a pool sized for concurrent Flask workers (the
+        # backend default is tuned for the single-user CLI), so bursts of
+        # lookups reuse keep-alive sockets instead of opening new TLS
+        # connections.
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504],
+                              # urllib3's default excludes POST, which is
+                              # what the HandicapsLST calls use
+                              allowed_methods=["GET", "POST"]),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
         # Visit the list page so ASP.NET sets up server-side state
         try:
             session.get(tgf.BASE_URL + "FederatedsList_V2.aspx?ccode=All", timeout=15)
@@ -81,7 +271,24 @@ def _invalidate_tgf_session():
         _tgf_session_time = 0
 
 
-def _search_with_session(session: requests.Session, query: str, is_fedno: bool) -> list[dict]:
+@dataclass(slots=True)
+class Player:
+    """One TGF player record.
+
+    Slots keep a 100-row response compact (no per-record __dict__) and
+    make the attribute reads below fixed-offset loads.
+    """
+    fed_no: int | str | None
+    name: str | None
+    club: str | None
+    club_code: str | None
+    hcp_index: float | None
+    hcp_status: str | None
+    gender: str | None
+    age_group: str | None
+
+
+def _search_with_session(session: requests.Session, query: str, is_fedno: bool) -> list[Player]:
     """Search for a player using an already-authenticated session."""
     api_url = tgf.BASE_URL + "FederatedsList_V2.aspx/HandicapsLST"
     payload = {
@@ -101,23 +308,31 @@ def _search_with_session(session: requests.Session, query: str, is_fedno: bool)
             "Referer": tgf.BASE_URL + "FederatedsList_V2.aspx",
         },
         timeout=15,
+        stream=ijson is not None,
     )
     resp.raise_for_status()
-    records = resp.json().get("d", {}).get("Records", [])
+    if ijson is not None:
+        # Decode records straight off the (decompressed) socket stream
+        # rather than buffering and parsing the whole body first.
+        resp.raw.decode_content = True
+        records = ijson.items(resp.raw, "d.Records.item")
+    else:
+        records = resp.json().get("d", {}).get("Records", [])
 
     players = []
     for r in records:
         hcp_raw = r.get("hcp_exact")
-        players.append({
-            "fed_no": r.get("federation_code"),
-            "name": r.get("name"),
-            "club": r.get("acronym"),
-            "club_code": r.get("club_code"),
-            "hcp_index": hcp_raw / 10.0 if hcp_raw is not None else None,
-            "hcp_status": r.get("hcp_status"),
-            "gender": r.get("gender"),
-            "age_group": r.get("age_level"),
-        })
+        players.append(Player(
+            fed_no=r.get("federation_code"),
+            name=r.get("name"),
+            club=r.get("acronym"),
+            club_code=r.get("club_code"),
+            # float() also normalises the Decimals ijson yields
+            hcp_index=float(hcp_raw) / 10.0 if hcp_raw is not None else None,
+            hcp_status=r.get("hcp_status"),
+            gender=r.get("gender"),
+            age_group=r.get("age_level"),
+        ))
     return players
 
 
@@ -126,926 +341,286 @@ def _search_with_session(session: requests.Session, query: str, is_fedno: bool)
 @app.route("/api/search_player", methods=["POST"])
 def api_search_player():
     """Search for a player by name or federation number (with caching)."""
-    data = request.get_json(force=True)
+    data = _request_json()
     query = (data.get("query") or "").strip()
     if not query:
-        return jsonify({"error": "Empty query"}), 400
+        return ojson({"error": "Empty query"}, 400)
+    return ojson(_search_one(query))
+
+
+@app.route("/api/search_players_batch", methods=["POST"])
+def api_search_players_batch():
+    """Search several players in one request.
+
+    The independent TGF lookups are fanned out over a thread pool
+    sharing the pooled session, so wall time is the slowest lookup
+    rather than the sum of them.
+    """
+    data = _request_json()
+    queries = [q.strip() for q in data.get("queries", [])
+               if isinstance(q, str) and q.strip()]
+    futures = [_search_pool.submit(_search_one, q) for q in queries]
+    return ojson({"results": {q: f.result() for q, f in zip(queries, futures)}})
 
-    is_fedno = query.isdigit()
-    cache_key = query.lower()
-    today = date.today()
+
+# Federation numbers are 1-7 ASCII digits; str.isdigit() also accepts
+# arbitrary-length unicode digits that the TGF API would reject anyway.
+_FEDNO_RE = re.compile(r"^\d{1,7}$", re.ASCII)
+
+
+def _search_one(query: str) -> dict:
+    """Cached player search for one query; returns the response payload."""
+    is_fedno = bool(_FEDNO_RE.match(query))
+    # casefold() handles Turkish dotted/dotless i where ASCII lower()
+    # creates duplicate cache entries; interning makes the repeated
+    # dict lookups on the same key pointer comparisons.
+    cache_key = sys.intern(query.casefold())
+    today = _today_epoch
 
     # ── Check server-side player cache (same day) ──
     with _player_cache_lock:
         cached = _player_cache.get(cache_key)
         if cached and cached["date"] == today:
-            players = cached["players"]
-            active = [p for p in players
-                      if p["hcp_index"] is not None and p["hcp_status"] == "Aktif"]
-            return jsonify({"players": active, "total_raw": len(players), "cached": True})
+            _player_cache.move_to_end(cache_key)
+            return {"players": cached["active"],
+                    "total_raw": len(cached["players"]),
+                    "cached": True}
+        # Not cached: claim the key, or wait on whoever already did.
+        fut = _in_flight.get(cache_key)
+        owner = fut is None
+        if owner:
+            fut = Future()
+            _in_flight[cache_key] = fut
+
+    if not owner:
+        # Another thread is already resolving this query – share its
+        # result. The cap sits above the owner's worst case (handshake
+        # retries plus the Selenium fallback's waits), and expiring it
+        # degrades to the normal error payload instead of a 500.
+        try:
+            return fut.result(timeout=45)
+        except TimeoutError:
+            return {"players": [], "total_raw": 0,
+                    "error": "TGF server did not respond. Please try again."}
 
-    # ── Not cached – search using shared TGF session ──
+    try:
+        result = _search_uncached(query, is_fedno, cache_key, today)
+        fut.set_result(result)
+        return result
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with _player_cache_lock:
+            _in_flight.pop(cache_key, None)
+
+
+def _search_uncached(query: str, is_fedno: bool, cache_key: str, today: int) -> dict:
+    """Resolve a query against TGF and populate the player cache."""
+    # ── Search using shared TGF session ──
     players = []
     try:
         session = _get_or_create_tgf_session()
         if session:
             players = _search_with_session(session, query, is_fedno)
     except Exception as e:
-        print(f"[search] Session-based search failed: {e}")
+        log.warning("Session-based search failed: %s", e)
         _invalidate_tgf_session()
 
     # ── Fallback to Selenium if session approach yielded nothing ──
     if not players:
         try:
             if is_fedno:
-                players = tgf._search_by_fedno_selenium(query)
+                raw = tgf._search_by_fedno_selenium(query)
             else:
-                print(f"[search] API returned no results for '{query}', trying Selenium...")
-                players = tgf.search_player_selenium(query)
+                log.warning("API returned no results for '%s', trying Selenium...", query)
+                raw = tgf.search_player_selenium(query)
+            players = [Player(**p) for p in raw]
         except Exception as e2:
-            print(f"[search] Selenium fallback also failed: {e2}")
+            log.warning("Selenium fallback also failed: %s", e2)
             players = []
 
+    # The active subset is stable for the day, so filter once here and
+    # store it (already serialised) alongside the raw records – cache
+    # hits skip both the scan and the dict conversion.
+    active = [asdict(p) for p in players
+              if p.hcp_index is not None and p.hcp_status == "Aktif"]
+
     # ── Cache successful results ──
     if players:
         with _player_cache_lock:
-            _player_cache[cache_key] = {"players": list(players), "date": today}
-
-    active = [p for p in players
-              if p["hcp_index"] is not None and p["hcp_status"] == "Aktif"]
+            _player_cache[cache_key] = {"players": list(players),
+                                        "active": active, "date": today}
+            _player_cache.move_to_end(cache_key)
+            if len(_player_cache) > _PLAYER_CACHE_MAX:
+                _player_cache.popitem(last=False)
 
     if not players:
-        return jsonify({"players": [], "total_raw": 0,
-                        "error": "TGF server did not respond. Please try again."})
+        return {"players": [], "total_raw": 0,
+                "error": "TGF server did not respond. Please try again."}
 
-    return jsonify({"players": active, "total_raw": len(players), "cached": False})
+    return {"players": active, "total_raw": len(players), "cached": False}
 
 
 @app.route("/api/courses", methods=["GET"])
 def api_courses():
     """Return all courses grouped by base name."""
-    courses = _get_courses_cached()
-
-    # Group by base name
-    grouped: dict[str, list[dict]] = {}
-    for c in courses:
-        base = c["name"].rsplit(" - ", 1)[0]
-        tee = c["name"].rsplit(" - ", 1)[-1] if " - " in c["name"] else ""
-        entry = {**c, "base_name": base, "tee": tee}
-        grouped.setdefault(base, []).append(entry)
-
-    return jsonify({"courses": grouped})
+    _get_courses_cached()
+    if not _course_index:
+        # The course fetch came back empty (TGF down?).  Don't hand out
+        # an ETag or max-age for that: the next request retries the
+        # fetch, and clients must not pin the empty list for an hour.
+        return Response(_courses_json_bytes or b'{"courses":{}}',
+                        mimetype="application/json",
+                        headers={"Cache-Control": "no-store"})
+    # The identity and gzip bodies are different bytes, so each gets its
+    # own strong ETag; Vary keeps shared caches from serving gzip to a
+    # client that did not ask for it.
+    use_gzip = "gzip" in request.headers.get("Accept-Encoding", "")
+    etag = _courses_json_etag[:-1] + '-gzip"' if use_gzip else _courses_json_etag
+    headers = {"ETag": etag,
+               "Cache-Control": "public, max-age=3600",
+               "Vary": "Accept-Encoding"}
+    # The payload only changes when the course cache is rebuilt, so a
+    # revalidating client gets an empty 304 instead of the full body.
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(_courses_json_gz, mimetype="application/json",
+                        headers=headers)
+    return Response(_courses_json_bytes, mimetype="application/json",
+                    headers=headers)
+
+
+@app.route("/api/courses/search", methods=["GET"])
+def api_courses_search():
+    """Return up to 20 base course names matching ?q= (case-insensitive)."""
+    _get_courses_cached()
+    q = request.args.get("q", "").casefold()
+    if not q:
+        return ojson([])
+    return ojson([orig for cf, orig in _course_search_idx if q in cf][:20])
 
 
 @app.route("/api/calculate", methods=["POST"])
 def api_calculate():
     """Calculate playing handicaps for given players on a course."""
-    data = request.get_json(force=True)
+    data = _request_json()
     players = data.get("players", [])      # [{name, hcp_index}, ...]
     course_base = data.get("course", "")
 
-    courses = _get_courses_cached()
-    matching = [c for c in courses
-                if c["name"].rsplit(" - ", 1)[0] == course_base]
-
-    if not matching:
-        return jsonify({"error": f"Course '{course_base}' not found"}), 404
-
-    tees_sorted = sorted(matching, key=lambda c: c["slope_18"], reverse=True)
+    _get_courses_cached()
+    tees_sorted = _course_index.get(course_base)
+
+    if not tees_sorted:
+        return ojson({"error": f"Course '{course_base}' not found"}, 404)
+
+    # Compute the whole tees x players grid with one NumPy broadcast
+    # (np.rint matches round()'s half-to-even behaviour); missing
+    # handicaps propagate as NaN and come back out as None, as do tees
+    # with a zero slope/rating.
+    if np is not None and players:
+        count = len(tees_sorted)
+        slope = np.fromiter((c["slope_18"] for c in tees_sorted),
+                            dtype=np.float64, count=count)
+        cr = np.fromiter((c["cr_18"] for c in tees_sorted),
+                         dtype=np.float64, count=count)
+        par = np.fromiter((c["par_18"] for c in tees_sorted),
+                          dtype=np.float64, count=count)
+        hcp = np.array([p.get("hcp_index") for p in players], dtype=np.float64)
+        if _calc_batch is not None:
+            grid = np.empty((count, len(players)))
+            _calc_batch(hcp, slope, cr, par, grid)
+        else:
+            grid = np.rint(hcp[None, :] * slope[:, None] / 113.0 + (cr - par)[:, None])
+        valid = ~np.isnan(grid) & ((slope != 0) & (cr != 0))[:, None]
+        phcp_rows = [
+            [int(v) if ok else None for v, ok in zip(grid_row, valid_row)]
+            for grid_row, valid_row in zip(grid, valid)
+        ]
+    else:
+        phcp_rows = [
+            [tgf.calc_playing_handicap(p.get("hcp_index"), c["slope_18"],
+                                       c["cr_18"], c["par_18"])
+             if p.get("hcp_index") is not None else None
+             for p in players]
+            for c in tees_sorted
+        ]
 
     results = []
-    for c in tees_sorted:
-        tee = c["name"].rsplit(" - ", 1)[-1] if " - " in c["name"] else c["name"]
-        row = {
-            "tee": tee,
+    for c, phcps in zip(tees_sorted, phcp_rows):
+        results.append({
+            "tee": c["tee"] or c["name"],
             "par": c["par_18"],
             "rating": c["cr_18"],
             "slope": c["slope_18"],
-            "handicaps": {},
-        }
-        for p in players:
-            hcp = p.get("hcp_index")
-            if hcp is not None:
-                phcp = tgf.calc_playing_handicap(
-                    hcp, c["slope_18"], c["cr_18"], c["par_18"]
-                )
-                row["handicaps"][p["name"]] = phcp
-            else:
-                row["handicaps"][p["name"]] = None
-        results.append(row)
+            "handicaps": {p["name"]: phcp for p, phcp in zip(players, phcps)},
+        })
 
-    return jsonify({"course": course_base, "tees": results, "players": players})
+    return ojson({"course": course_base, "tees": results, "players": players})
 
 
 # ── Main HTML page ───────────────────────────────────────────────────
 
-HTML_PAGE = r"""
-<!DOCTYPE html>
-<html lang="tr">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>TGF Playing Handicap Calculator</title>
-<style>
-  :root {
-    --green: #2e7d32;
-    --green-light: #4caf50;
-    --green-bg: #e8f5e9;
-    --dark: #1b5e20;
-    --gray: #f5f5f5;
-    --border: #c8e6c9;
-    --white: #ffffff;
-    --shadow: 0 2px 8px rgba(0,0,0,.1);
-    --radius: 8px;
-  }
-  * { box-sizing: border-box; margin: 0; padding: 0; }
-  body {
-    font-family: 'Segoe UI', system-ui, -apple-system, sans-serif;
-    background: var(--gray);
-    color: #333;
-    min-height: 100vh;
-    padding-bottom: 2rem;
-    overflow-x: hidden;
-    -webkit-overflow-scrolling: touch;
-  }
-  header {
-    background: linear-gradient(135deg, var(--dark), var(--green));
-    color: white;
-    padding: 1.2rem 2rem;
-    display: flex;
-    align-items: center;
-    gap: 1rem;
-    box-shadow: var(--shadow);
-  }
-  header h1 { font-size: 1.4rem; font-weight: 600; }
-  header .subtitle { font-size: .85rem; opacity: .85; }
-  .container { max-width: 1100px; margin: 1.5rem auto; padding: 0 1rem; }
-
-  /* ── Cards ── */
-  .card {
-    background: var(--white);
-    border-radius: var(--radius);
-    box-shadow: var(--shadow);
-    margin-bottom: 1.2rem;
-  }
-  .card-header {
-    background: var(--green-bg);
-    border-bottom: 2px solid var(--border);
-    padding: .8rem 1.2rem;
-    font-weight: 600;
-    color: var(--dark);
-    display: flex;
-    align-items: center;
-    gap: .5rem;
-    border-radius: var(--radius) var(--radius) 0 0;
-  }
-  .card-header .step {
-    background: var(--green);
-    color: white;
-    width: 26px; height: 26px;
-    border-radius: 50%;
-    display: flex; align-items: center; justify-content: center;
-    font-size: .8rem;
-  }
-  .card-body { padding: 1.2rem; }
-
-  /* ── Inputs ── */
-  .player-row {
-    display: flex;
-    gap: .5rem;
-    margin-bottom: .5rem;
-    align-items: center;
-  }
-  .player-row input {
-    flex: 1;
-    padding: .55rem .75rem;
-    border: 1px solid #ccc;
-    border-radius: 6px;
-    font-size: .95rem;
-    transition: border-color .2s;
-  }
-  .player-row input:focus { outline: none; border-color: var(--green-light); box-shadow: 0 0 0 3px rgba(76,175,80,.15); }
-  .player-row .remove-btn {
-    background: none; border: none; color: #c62828; cursor: pointer;
-    font-size: 1.3rem; padding: 0 .3rem; line-height: 1;
-  }
-  .player-row .remove-btn:hover { color: #b71c1c; }
-  .player-row .status {
-    font-size: .8rem;
-    min-width: 180px;
-    white-space: nowrap;
-    overflow: hidden;
-    text-overflow: ellipsis;
-  }
-  .player-row .hcp-edit {
-    width: 60px;
-    padding: .3rem .4rem;
-    border: 1px solid #ccc;
-    border-radius: 4px;
-    font-size: .85rem;
-    text-align: center;
-    font-weight: 600;
-    flex-shrink: 0;
-  }
-  .player-row .hcp-edit:focus {
-    outline: none;
-    border-color: var(--green-light);
-    box-shadow: 0 0 0 3px rgba(76,175,80,.15);
-  }
-  .player-row .hcp-edit.modified {
-    border-color: #f57c00;
-    background: #fff8e1;
-  }
-  .status.found { color: var(--green); }
-  .status.error { color: #c62828; }
-  .status.searching { color: #f57c00; }
-
-  .btn {
-    padding: .55rem 1.2rem;
-    border: none;
-    border-radius: 6px;
-    font-size: .9rem;
-    cursor: pointer;
-    font-weight: 500;
-    transition: background .2s, transform .1s;
-  }
-  .btn:active { transform: scale(.97); }
-  .btn-green { background: var(--green); color: white; }
-  .btn-green:hover { background: var(--green-light); }
-  .btn-outline { background: white; color: var(--green); border: 1px solid var(--green); }
-  .btn-outline:hover { background: var(--green-bg); }
-  .btn-sm { padding: .4rem .8rem; font-size: .82rem; }
-  .btn:disabled { opacity: .5; cursor: not-allowed; }
-
-  .btn-row { display: flex; gap: .5rem; margin-top: .8rem; flex-wrap: wrap; }
-
-  /* ── Course select ── */
-  .course-search {
-    position: relative;
-  }
-  .course-search input {
-    width: 100%;
-    padding: .55rem .75rem;
-    border: 1px solid #ccc;
-    border-radius: 6px;
-    font-size: .95rem;
-  }
-  .course-search input:focus { outline: none; border-color: var(--green-light); box-shadow: 0 0 0 3px rgba(76,175,80,.15); }
-  .course-dropdown {
-    position: absolute;
-    top: 100%;
-    left: 0; right: 0;
-    background: white;
-    border: 1px solid #ccc;
-    border-top: none;
-    border-radius: 0 0 6px 6px;
-    max-height: 250px;
-    overflow-y: auto;
-    z-index: 999;
-    display: none;
-    box-shadow: 0 4px 12px rgba(0,0,0,.15);
-  }
-  .course-dropdown.open { display: block; }
-  .course-item {
-    padding: .5rem .75rem;
-    cursor: pointer;
-    font-size: .9rem;
-    border-bottom: 1px solid #f0f0f0;
-  }
-  .course-item:hover, .course-item:active { background: var(--green-bg); }
-  .course-item .tees { font-size: .75rem; color: #666; margin-top: 2px; }
-
-  /* ── Course bottom-sheet overlay for mobile ── */
-  .course-sheet-backdrop {
-    display: none;
-    position: fixed;
-    top: 0; left: 0; right: 0; bottom: 0;
-    background: rgba(0,0,0,.4);
-    z-index: 998;
-  }
-  .course-sheet-backdrop.open { display: block; }
-  .course-selected {
-    margin-top: .6rem;
-    padding: .6rem;
-    background: var(--green-bg);
-    border-radius: 6px;
-    font-size: .9rem;
-  }
-  .course-selected strong { color: var(--dark); }
-
-  /* ── Tee badges ── */
-  .tee-badge {
-    display: inline-block;
-    padding: .15rem .4rem;
-    border-radius: 4px;
-    font-size: .75rem;
-    font-weight: 600;
-    min-width: 45px;
-    text-align: center;
-  }
-  .tee-WHITE  { background: #f5f5f5; color: #333; border: 1px solid #bbb; }
-  .tee-BLACK  { background: #212121; color: #fff; }
-  .tee-YELLOW { background: #fdd835; color: #333; }
-  .tee-BLUE   { background: #1565c0; color: #fff; }
-  .tee-RED    { background: #c62828; color: #fff; }
-  .tee-GREEN  { background: #2e7d32; color: #fff; }
-  .tee-GOLD   { background: #f9a825; color: #333; }
-
-  /* ── Results table ── */
-  .table-scroll {
-    overflow-x: auto;
-    -webkit-overflow-scrolling: touch;
-  }
-  .results-table {
-    width: 100%;
-    border-collapse: collapse;
-    font-size: .85rem;
-  }
-  .results-table th {
-    background: var(--dark);
-    color: white;
-    padding: .4rem .4rem;
-    text-align: center;
-    font-weight: 500;
-    white-space: nowrap;
-  }
-  .results-table th:first-child { text-align: left; }
-  .results-table td {
-    padding: .4rem .4rem;
-    text-align: center;
-    border-bottom: 1px solid #e0e0e0;
-    white-space: nowrap;
-  }
-  .results-table td:first-child { text-align: left; }
-  .results-table tr:hover td { background: #f1f8e9; }
-  .results-table .hcp-cell {
-    font-weight: 700;
-    font-size: 1.05rem;
-    color: var(--dark);
-  }
-  .player-hdr { font-size: .7rem; color: rgba(255,255,255,.7); font-weight: 400; }
-  .player-name { font-size: .8rem; line-height: 1.2; }
-
-  /* ── Disambiguation modal ── */
-  .modal-overlay {
-    position: fixed; top:0;left:0;right:0;bottom:0;
-    background: rgba(0,0,0,.45);
-    z-index: 500;
-    display: flex; align-items: center; justify-content: center;
-  }
-  .modal {
-    background: white;
-    border-radius: var(--radius);
-    box-shadow: 0 8px 32px rgba(0,0,0,.25);
-    max-width: 700px; width: 95%;
-    max-height: 80vh;
-    overflow-y: auto;
-    padding: 1.5rem;
-  }
-  .modal h3 { margin-bottom: 1rem; color: var(--dark); }
-  .modal table { width: 100%; border-collapse: collapse; font-size: .85rem; }
-  .modal th { background: var(--green-bg); padding: .5rem; text-align: left; }
-  .modal td { padding: .5rem; border-bottom: 1px solid #eee; }
-  .modal tr.selectable { cursor: pointer; }
-  .modal tr.selectable:hover td { background: #e8f5e9; }
-
-  /* ── Spinner ── */
-  .spinner {
-    display: inline-block;
-    width: 16px; height: 16px;
-    border: 2px solid var(--green-bg);
-    border-top-color: var(--green);
-    border-radius: 50%;
-    animation: spin .6s linear infinite;
-    vertical-align: middle;
-    margin-right: 4px;
-  }
-  @keyframes spin { to { transform: rotate(360deg); } }
-
-  .hidden { display: none !important; }
-
-  /* ── Footer ── */
-  footer {
-    text-align: center;
-    padding: 1.5rem;
-    color: #888;
-    font-size: .8rem;
-  }
-  footer a { color: var(--green); text-decoration: none; }
-
-  /* responsive */
-  @media (max-width: 600px) {
-    header { padding: .8rem 1rem; }
-    header h1 { font-size: 1.1rem; }
-    .container { padding: 0 .5rem; margin-top: .8rem; }
-    .card-body { padding: .8rem; }
-    body { padding-bottom: 4rem; }
-
-    /* Player rows: compact on mobile */
-    .player-row { flex-wrap: nowrap; }
-    .player-row input[type="text"] { font-size: .85rem; padding: .45rem .5rem; }
-    .player-row .status { min-width: 0; flex: 1; font-size: .7rem; }
-    .player-row .hcp-edit { width: 48px; font-size: .8rem; padding: .25rem .3rem; }
-    .player-row .remove-btn { font-size: 1.1rem; }
-
-    /* Course dropdown → fixed bottom sheet on mobile */
-    .course-dropdown {
-      position: fixed !important;
-      top: auto !important;
-      bottom: 0;
-      left: 0; right: 0;
-      max-height: 55vh;
-      border-radius: 16px 16px 0 0;
-      border: none;
-      box-shadow: 0 -4px 24px rgba(0,0,0,.25);
-      z-index: 1000;
-      padding-top: .3rem;
-    }
-    .course-dropdown::before {
-      content: '';
-      display: block;
-      width: 40px; height: 4px;
-      background: #ccc;
-      border-radius: 2px;
-      margin: .4rem auto .2rem;
-    }
-    .course-item { padding: .7rem .9rem; font-size: .95rem; }
-    .course-item .tees { font-size: .8rem; }
-  }
-</style>
-</head>
-<body>
-
-<header>
-  <div>
-    <h1>TGF Playing Handicap Calculator</h1>
-    <div class="subtitle">Turkish Golf Federation &middot; WHS Playing Handicap</div>
-  </div>
-</header>
-
-<div class="container">
-
-  <!-- ════ STEP 1: Players ════ -->
-  <div class="card">
-    <div class="card-header">
-      <span class="step">1</span> Players
-    </div>
-    <div class="card-body">
-      <p style="font-size:.85rem; color:#666; margin-bottom:.8rem;">
-        Enter player names or TGF Federation Numbers. One per row.
-      </p>
-      <div id="playerRows"></div>
-      <div class="btn-row">
-        <button class="btn btn-outline btn-sm" onclick="addPlayerRow()">+ Add Player</button>
-        <button class="btn btn-green" id="btnSearchPlayers" onclick="searchAllPlayers()">
-          Search Players
-        </button>
-      </div>
-    </div>
-  </div>
-
-  <!-- ════ STEP 2: Course ════ -->
-  <div class="card">
-    <div class="card-header">
-      <span class="step">2</span> Course
-    </div>
-    <div class="card-body">
-      <div class="course-search">
-        <input type="text" id="courseInput" placeholder="Type a course name (e.g. Kemer, Gloria, Carya...)"
-               oninput="filterCourses()" onfocus="filterCourses()" onkeydown="courseKeydown(event)" autocomplete="off">
-        <div class="course-dropdown" id="courseDropdown"></div>
-      </div>
-      <div id="courseInfo" class="hidden"></div>
-    </div>
-  </div>
-
-  <!-- ════ STEP 3: Results ════ -->
-  <div class="card" id="resultsCard" style="display:none">
-    <div class="card-header">
-      <span class="step">3</span> Playing Handicaps
-    </div>
-    <div class="card-body" id="resultsBody"></div>
-  </div>
-
-</div>
-
-<footer>
-  Data from <a href="https://www.tgf.org.tr" target="_blank">tgf.org.tr</a> &middot;
-  Formula: Playing HCP = round(HCP Index &times; Slope / 113 + (Rating &minus; PAR))
-</footer>
-
-<!-- ════ Course bottom-sheet backdrop (mobile) ════ -->
-<div class="course-sheet-backdrop" id="courseBackdrop"></div>
-
-<!-- ════ Disambiguation modal (hidden) ════ -->
-<div id="disambigModal" class="modal-overlay hidden">
-  <div class="modal">
-    <h3 id="disambigTitle">Select Player</h3>
-    <table>
-      <thead>
-        <tr><th>#</th><th>Name</th><th>Fed.No</th><th>Club</th><th>HCP</th><th>Gender</th><th>Age</th></tr>
-      </thead>
-      <tbody id="disambigBody"></tbody>
-    </table>
-  </div>
-</div>
-
-<script>
-// ── State ──
-let confirmedPlayers = [];   // [{name, fed_no, club, hcp_index, gender, ...}]
-let allCourses = {};         // {baseName: [{name, tee, par_18, cr_18, slope_18, ...}]}
-let selectedCourse = null;   // base name string
-let playerCache = {};        // {query_lower: confirmedPlayer} – avoids redundant lookups
-
-// ── Helpers ──
-function isMobile() { return window.innerWidth <= 600; }
-
-function closeCourseDropdown() {
-  document.getElementById('courseDropdown').classList.remove('open');
-  document.getElementById('courseBackdrop').classList.remove('open');
-}
-
-// ── Init ──
-document.addEventListener('DOMContentLoaded', () => {
-  addPlayerRow();
-  addPlayerRow();
-  addPlayerRow();
-  addPlayerRow();
-  loadCourses();
-
-  // Close dropdown when clicking outside (desktop) or on backdrop (mobile)
-  document.addEventListener('click', e => {
-    if (!e.target.closest('.course-search') && !e.target.closest('.course-dropdown')) {
-      closeCourseDropdown();
-    }
-  });
-  document.getElementById('courseBackdrop').addEventListener('click', closeCourseDropdown);
-});
-
-// ── Player rows ──
-function addPlayerRow(value) {
-  const div = document.getElementById('playerRows');
-  const row = document.createElement('div');
-  row.className = 'player-row';
-  row.innerHTML = `
-    <input type="text" placeholder="Player name or Federation Number" value="${value || ''}"
-           onkeydown="if(event.key==='Enter') searchAllPlayers()">
-    <span class="status"></span>
-    <button class="remove-btn" title="Remove" onclick="removePlayerRow(this)">&times;</button>
-  `;
-  div.appendChild(row);
-  row.querySelector('input').focus();
-}
-
-function removePlayerRow(btn) {
-  const rows = document.querySelectorAll('.player-row');
-  if (rows.length <= 1) return;  // keep at least one
-  btn.closest('.player-row').remove();
-}
-
-// ── Search players ──
-async function searchAllPlayers() {
-  const rows = document.querySelectorAll('.player-row');
-  const btn = document.getElementById('btnSearchPlayers');
-  btn.disabled = true;
-  btn.innerHTML = '<span class="spinner"></span> Searching...';
-
-  confirmedPlayers = [];   // rebuild from all rows (cached + fresh)
-
-  for (const row of rows) {
-    const input = row.querySelector('input');
-    const status = row.querySelector('.status');
-    const query = input.value.trim();
-    if (!query) {
-      status.textContent = '';
-      status.className = 'status';
-      continue;
-    }
+# The page lives in static/index.html; read it once at import. It is
+# plain bytes with no template variables, so no Jinja render is needed.
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+with open(os.path.join(_STATIC_DIR, "index.html"), "rb") as _f:
+    _HTML_TEMPLATE = _f.read()
 
-    const cacheKey = query.toLowerCase();
 
-    // ── Use cached result if available (avoids redundant lookups) ──
-    if (playerCache[cacheKey]) {
-      pickPlayer(playerCache[cacheKey], status);
-      continue;
-    }
+# The page gets the course payload inlined into it, then is encoded and
+# compressed once. Built lazily on the first request (not at import) so
+# gunicorn workers don't all fetch the course list during boot.
+_html_lock = threading.Lock()
+_html_bytes: bytes | None = None
+_html_gz: bytes = b""
+_html_br: bytes | None = None
 
-    status.innerHTML = '<span class="spinner"></span> Searching...';
-    status.className = 'status searching';
-
-    try {
-      const resp = await fetch('/api/search_player', {
-        method: 'POST',
-        headers: {'Content-Type': 'application/json'},
-        body: JSON.stringify({query})
-      });
-      const data = await resp.json();
-
-      if (data.error && (!data.players || data.players.length === 0)) {
-        status.textContent = data.error;
-        status.className = 'status error';
-        continue;
-      }
-
-      const players = data.players || [];
-      if (players.length === 0) {
-        status.textContent = 'No active player found — try again if TGF server was slow';
-        status.className = 'status error';
-      } else if (players.length === 1) {
-        playerCache[cacheKey] = players[0];
-        pickPlayer(players[0], status);
-      } else {
-        // Try exact match first
-        const queryLower = query.toLowerCase();
-        const exact = players.filter(p => p.name.toLowerCase() === queryLower);
-        if (exact.length === 1) {
-          playerCache[cacheKey] = exact[0];
-          pickPlayer(exact[0], status);
-        } else {
-          // Disambiguate
-          const chosen = await showDisambig(query, exact.length > 1 ? exact : players);
-          if (chosen) {
-            playerCache[cacheKey] = chosen;
-            pickPlayer(chosen, status);
-          } else {
-            status.textContent = 'No player selected';
-            status.className = 'status error';
-          }
-        }
-      }
-    } catch (err) {
-      status.textContent = 'Network error';
-      status.className = 'status error';
-    }
-  }
-
-  btn.disabled = false;
-  btn.innerHTML = 'Search Players';
-  tryCalculate();
-}
-
-function pickPlayer(p, statusEl) {
-  confirmedPlayers.push(p);
-  // Show player info with an editable HCP input
-  const row = statusEl.closest('.player-row');
-  // Remove any previous hcp-edit input in this row
-  const oldEdit = row.querySelector('.hcp-edit');
-  if (oldEdit) oldEdit.remove();
-
-  statusEl.innerHTML = `&#10003; <b>${p.name}</b> &middot; ${p.club}`;
-  statusEl.className = 'status found';
-
-  // Insert editable HCP field after the status span
-  const hcpInput = document.createElement('input');
-  hcpInput.type = 'text';
-  hcpInput.className = 'hcp-edit';
-  hcpInput.value = p.hcp_index;
-  hcpInput.title = 'Edit handicap index';
-  hcpInput.dataset.originalHcp = p.hcp_index;
-  hcpInput.dataset.playerName = p.name;
-  hcpInput.addEventListener('input', function() {
-    // Highlight if modified from original
-    if (parseFloat(this.value) !== parseFloat(this.dataset.originalHcp)) {
-      this.classList.add('modified');
-    } else {
-      this.classList.remove('modified');
-    }
-  });
-  hcpInput.addEventListener('change', function() {
-    const val = parseFloat(this.value);
-    if (isNaN(val)) {
-      this.value = this.dataset.originalHcp;
-      this.classList.remove('modified');
-      return;
-    }
-    // Update the confirmedPlayers entry with the overridden value
-    const cp = confirmedPlayers.find(cp => cp.name === this.dataset.playerName);
-    if (cp) cp.hcp_index = val;
-    tryCalculate();
-  });
-  // Insert before the remove button
-  const removeBtn = row.querySelector('.remove-btn');
-  row.insertBefore(hcpInput, removeBtn);
-}
-
-// ── Disambiguation modal ──
-function showDisambig(query, players) {
-  return new Promise(resolve => {
-    const modal = document.getElementById('disambigModal');
-    const title = document.getElementById('disambigTitle');
-    const body = document.getElementById('disambigBody');
-
-    title.textContent = `Multiple players found for "${query}" — click to select:`;
-    body.innerHTML = '';
-
-    players.forEach((p, i) => {
-      const tr = document.createElement('tr');
-      tr.className = 'selectable';
-      tr.innerHTML = `
-        <td>${i+1}</td>
-        <td><b>${p.name}</b></td>
-        <td>${p.fed_no}</td>
-        <td>${p.club} (${p.club_code})</td>
-        <td>${p.hcp_index}</td>
-        <td>${p.gender}</td>
-        <td>${p.age_group}</td>
-      `;
-      tr.addEventListener('click', () => {
-        modal.classList.add('hidden');
-        resolve(p);
-      });
-      body.appendChild(tr);
-    });
-
-    modal.classList.remove('hidden');
-    // close on overlay click
-    modal.addEventListener('click', function handler(e) {
-      if (e.target === modal) {
-        modal.classList.add('hidden');
-        modal.removeEventListener('click', handler);
-        resolve(null);
-      }
-    });
-  });
-}
-
-// ── Course loading & filtering ──
-async function loadCourses() {
-  try {
-    const resp = await fetch('/api/courses');
-    const data = await resp.json();
-    allCourses = data.courses || {};
-  } catch (e) {
-    console.error('Failed to load courses', e);
-  }
-}
-
-function filterCourses() {
-  const q = document.getElementById('courseInput').value.trim().toLowerCase();
-  const dd = document.getElementById('courseDropdown');
-  const backdrop = document.getElementById('courseBackdrop');
-  dd.innerHTML = '';
-
-  if (q.length < 1) { closeCourseDropdown(); return; }
-
-  const names = Object.keys(allCourses).filter(n => n.toLowerCase().includes(q)).sort();
-
-  if (names.length === 0) {
-    dd.innerHTML = '<div class="course-item" style="color:#999">No courses found</div>';
-    dd.classList.add('open');
-    if (isMobile()) backdrop.classList.add('open');
-    return;
-  }
-
-  names.slice(0, 20).forEach(name => {
-    const tees = allCourses[name].map(c => c.tee).join(', ');
-    const div = document.createElement('div');
-    div.className = 'course-item';
-    div.innerHTML = `<div><b>${name}</b></div><div class="tees">Tees: ${tees}</div>`;
-    div.addEventListener('click', () => selectCourse(name));
-    dd.appendChild(div);
-  });
-  dd.classList.add('open');
-  if (isMobile()) backdrop.classList.add('open');
-}
-
-function courseKeydown(e) {
-  if (e.key !== 'Enter') return;
-  e.preventDefault();
-
-  const q = document.getElementById('courseInput').value.trim().toLowerCase();
-  if (!q) return;
-
-  const names = Object.keys(allCourses).filter(n => n.toLowerCase().includes(q)).sort();
-  if (names.length === 0) return;
-
-  // Prefer an exact match (case-insensitive), otherwise pick the first result
-  const exact = names.find(n => n.toLowerCase() === q);
-  selectCourse(exact || names[0]);
-}
-
-function selectCourse(baseName) {
-  selectedCourse = baseName;
-  document.getElementById('courseInput').value = baseName;
-  closeCourseDropdown();
-
-  // Show course info
-  const tees = allCourses[baseName] || [];
-  const teesSorted = [...tees].sort((a, b) => b.slope_18 - a.slope_18);
-
-  let html = `<div class="course-selected"><strong>${baseName}</strong>
-    <table style="width:100%; margin-top:.5rem; font-size:.82rem; border-collapse:collapse;">
-    <tr style="background:var(--green-bg)">
-      <th style="padding:4px 6px; text-align:left">Tee</th>
-      <th style="padding:4px 6px">PAR</th>
-      <th style="padding:4px 6px">Rating</th>
-      <th style="padding:4px 6px">Slope</th>
-    </tr>`;
-  teesSorted.forEach(t => {
-    const cls = 'tee-' + t.tee;
-    html += `<tr>
-      <td style="padding:4px 6px"><span class="tee-badge ${cls}">${t.tee}</span></td>
-      <td style="padding:4px 6px; text-align:center">${t.par_18}</td>
-      <td style="padding:4px 6px; text-align:center">${t.cr_18.toFixed(1)}</td>
-      <td style="padding:4px 6px; text-align:center">${t.slope_18}</td>
-    </tr>`;
-  });
-  html += '</table></div>';
-
-  const info = document.getElementById('courseInfo');
-  info.innerHTML = html;
-  info.classList.remove('hidden');
-
-  tryCalculate();
-}
-
-// ── Calculate ──
-async function tryCalculate() {
-  if (confirmedPlayers.length === 0 || !selectedCourse) return;
-
-  // Read current HCP values from editable inputs (picks up any overrides)
-  const hcpEdits = document.querySelectorAll('.hcp-edit');
-  hcpEdits.forEach(input => {
-    const val = parseFloat(input.value);
-    if (!isNaN(val)) {
-      const cp = confirmedPlayers.find(cp => cp.name === input.dataset.playerName);
-      if (cp) cp.hcp_index = val;
-    }
-  });
-
-  const resp = await fetch('/api/calculate', {
-    method: 'POST',
-    headers: {'Content-Type': 'application/json'},
-    body: JSON.stringify({
-      players: confirmedPlayers.map(p => ({name: p.name, hcp_index: p.hcp_index})),
-      course: selectedCourse
-    })
-  });
-  const data = await resp.json();
-  if (data.error) return;
-
-  renderResults(data);
-}
-
-function renderResults(data) {
-  const card = document.getElementById('resultsCard');
-  const body = document.getElementById('resultsBody');
-
-  let html = `<p style="margin-bottom:.8rem; font-size:.95rem;">
-    <strong>${data.course}</strong></p>`;
-
-  html += '<div class="table-scroll"><table class="results-table"><thead><tr>';
-  html += '<th>Tee</th><th>PAR</th><th>CR</th><th>SL</th>';
-  data.players.forEach(p => {
-    // Split name: first name on top, surname below
-    const parts = p.name.split(' ');
-    let nameHtml;
-    if (parts.length >= 2) {
-      const firstName = parts.slice(0, -1).join(' ');
-      const surname = parts[parts.length - 1];
-      nameHtml = `<span class="player-name">${firstName}<br>${surname}</span>`;
-    } else {
-      nameHtml = `<span class="player-name">${p.name}</span>`;
-    }
-    html += `<th>${nameHtml}<br><span class="player-hdr">HCP ${p.hcp_index}</span></th>`;
-  });
-  html += '</tr></thead><tbody>';
-
-  data.tees.forEach(t => {
-    const cls = 'tee-' + t.tee;
-    html += '<tr>';
-    html += `<td><span class="tee-badge ${cls}">${t.tee}</span></td>`;
-    html += `<td>${t.par}</td>`;
-    html += `<td>${t.rating.toFixed(1)}</td>`;
-    html += `<td>${t.slope}</td>`;
-    data.players.forEach(p => {
-      const val = t.handicaps[p.name];
-      html += `<td class="hcp-cell">${val !== null ? val : 'N/A'}</td>`;
-    });
-    html += '</tr>';
-  });
-
-  html += '</tbody></table></div>';
-
-  body.innerHTML = html;
-  card.style.display = '';
-  card.scrollIntoView({behavior: 'smooth', block: 'nearest'});
-}
-</script>
-</body>
-</html>
-"""
+
+def _build_html() -> None:
+    global _html_bytes, _html_gz, _html_br
+    _get_courses_cached()
+    # "</" must not appear literally inside a <script> block
+    blob = _courses_json_bytes.replace(b"</", b"<\\/")
+    inject = b"<script>window.__COURSES__ = " + blob + b".courses;</script>"
+    body = _HTML_TEMPLATE.replace(
+        b"<script>/*INJECT_COURSES*/</script>", inject, 1)
+    # Build everything into locals first: index()'s fast path checks
+    # _html_bytes without the lock, so it must be published last or a
+    # concurrent request could be served the still-empty _html_gz.
+    _html_gz = gzip.compress(body, 9)
+    if brotli is not None:
+        _html_br = brotli.compress(body, quality=11)
+    _html_bytes = body
 
 
 @app.route("/")
 def index():
-    return render_template_string(HTML_PAGE)
+    if _html_bytes is None:
+        with _html_lock:
+            if _html_bytes is None:
+                _build_html()
+    accept_encoding = request.headers.get("Accept-Encoding", "")
+    if _html_br is not None and "br" in accept_encoding:
+        return Response(_html_br, mimetype="text/html",
+                        headers={"Content-Encoding": "br",
+                                 "Vary": "Accept-Encoding"})
+    if "gzip" in accept_encoding:
+        return Response(_html_gz, mimetype="text/html",
+                        headers={"Content-Encoding": "gzip",
+                                 "Vary": "Accept-Encoding"})
+    return Response(_html_bytes, mimetype="text/html",
+                    headers={"Vary": "Accept-Encoding"})
 
 
 # ── Run ──────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     import webbrowser, threading
 
+    logging.basicConfig(level=logging.WARNING)
+
     print()
     print("  TGF Playing Handicap Calculator")
     print("  ================================")
@@ -1060,4 +635,10 @@ if __name__ == "__main__":
     # Auto-open browser after a short delay
     threading.Timer(1.5, lambda: webbrowser.open("http://localhost:5000")).start()
 
-    app.run(host="127.0.0.1", port=5000, debug=False)
+    # Waitress serves requests concurrently; the Flask dev server is
+    # single-threaded and stalls batch searches behind each other.
+    try:
+        from waitress import serve
+        serve(app, host="127.0.0.1", port=5000, threads=16)
+    except ImportError:
+        app.run(host="127.0.0.1", port=5000, debug=False)